@@ -2,6 +2,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 from _Framework.ControlSurface import ControlSurface
+import functools
 import socket
 import json
 import threading
@@ -28,23 +29,38 @@ TOKEN_PATTERN = re.compile(r'(\\.|\\|["]|[\[\]{}])')
 DEFAULT_PORT = 9877
 HOST = "localhost"
 
+# Pre-bound math functions: a module-global load instead of a LOAD_GLOBAL
+# math + LOAD_ATTR pair on every call in the hot conversion helpers
+_log = math.log
+_exp = math.exp
+
 # Constants for frequency/Q conversion optimization (Natural Logarithm)
 DEFAULT_MIN_FREQ = 10.0
 DEFAULT_MAX_FREQ = 22000.0
 DEFAULT_FREQ_LN_MIN = math.log(DEFAULT_MIN_FREQ)
 DEFAULT_FREQ_LN_MAX = math.log(DEFAULT_MAX_FREQ)
 DEFAULT_FREQ_LN_RANGE = DEFAULT_FREQ_LN_MAX - DEFAULT_FREQ_LN_MIN
+# Reciprocal so the hot conversion path multiplies instead of divides
+DEFAULT_FREQ_LN_RANGE_INV = 1.0 / DEFAULT_FREQ_LN_RANGE
 
 DEFAULT_MIN_Q = 0.1
 DEFAULT_MAX_Q = 18.0
 DEFAULT_Q_LN_MIN = math.log(DEFAULT_MIN_Q)
 DEFAULT_Q_LN_MAX = math.log(DEFAULT_MAX_Q)
 DEFAULT_Q_LN_RANGE = DEFAULT_Q_LN_MAX - DEFAULT_Q_LN_MIN
+# Reciprocal so the hot conversion path multiplies instead of divides
+DEFAULT_Q_LN_RANGE_INV = 1.0 / DEFAULT_Q_LN_RANGE
 
 # Constant for dB conversion optimization
 # 20 * log10(x) = 20 * (ln(x) / ln(10)) = (20 / ln(10)) * ln(x)
 DB_SCALE_CONSTANT = 20.0 / math.log(10.0)
 
+# Piecewise linear->dB mapping constants (0.85 -> 0 dB, 1.0 -> +6 dB),
+# precomputed so the hot path multiplies instead of dividing
+DB_ZERO_POINT = 0.85
+DB_ZERO_POINT_INV = 1.0 / DB_ZERO_POINT
+DB_ABOVE_ZERO_SLOPE = 6.0 / 0.15
+
 # Pre-defined presets to avoid recreation on every call
 EQ_PRESETS = {
     "low_cut": {
@@ -79,6 +95,60 @@ EQ_PRESETS = {
 }
 
 
+def _linear_to_db_exact(value):
+    """Exact linear volume (0.0-1.0) to dB conversion. See _linear_to_db."""
+    # Add a small epsilon to prevent extreme negative values
+    # when value is very close to zero but not exactly zero
+    epsilon = 1e-7
+
+    if value <= epsilon:
+        return float('-inf')  # -infinity dB for zero or near-zero volume
+
+    # Ableton's volume mapping is approximately:
+    # 0.85 -> 0dB
+    # 0.0 -> -inf dB
+    # 1.0 -> +6dB
+
+    if value < DB_ZERO_POINT:
+        # Below 0dB
+        # Optimization: Use natural log with pre-calculated constant (faster than log10)
+        return DB_SCALE_CONSTANT * _log(value * DB_ZERO_POINT_INV)
+    else:
+        # Above 0dB (0.85 to 1.0 maps to 0dB to +6dB)
+        return (value - DB_ZERO_POINT) * DB_ABOVE_ZERO_SLOPE
+
+
+# Lookup table over the 0.001-step grid. Mixer values arriving over the
+# LLM interface almost always carry 2-3 significant digits, so they land
+# exactly on this grid and the conversion becomes a list index.
+_DB_LUT = [_linear_to_db_exact(i / 1000.0) for i in range(1001)]
+
+
+def _specialize_to_norm(ln_min, ln_range_inv):
+    """Build a cached to-normalized converter with its range baked in.
+
+    The returned closure carries the log bounds and the log function as
+    cell variables, so the hot path does no module-global lookups at all.
+    Callers must pass an already-clamped float.
+    """
+    log = _log
+
+    @functools.lru_cache(maxsize=1024)
+    def to_norm(value):
+        return (log(value) - ln_min) * ln_range_inv
+
+    return to_norm
+
+
+# Default-range converters, specialized once at module load. EQ
+# frequencies and Q values from presets and prompts snap to a small set
+# of points, so repeated values also hit the lru_cache.
+_freq_to_norm_default = _specialize_to_norm(
+    DEFAULT_FREQ_LN_MIN, DEFAULT_FREQ_LN_RANGE_INV)
+_q_to_norm_default = _specialize_to_norm(
+    DEFAULT_Q_LN_MIN, DEFAULT_Q_LN_RANGE_INV)
+
+
 def create_instance(c_instance):
     """Create and return the AbletonMCP script instance"""
     return AbletonMCP(c_instance)
@@ -977,7 +1047,8 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
 
-    def _frequency_to_normalized(self, frequency, min_freq=10.0, max_freq=22000.0):
+    @staticmethod
+    def _frequency_to_normalized(frequency, min_freq=10.0, max_freq=22000.0):
         """
         Convert frequency in Hz to normalized value (0-1) using precise logarithmic scale.
 
@@ -1006,23 +1077,27 @@ class AbletonMCP(ControlSurface):
             raise ValueError(
                 "Minimum frequency must be positive for logarithmic scale")
 
-        if frequency < min_freq:
-            frequency = min_freq
-        if frequency > max_freq:
-            frequency = max_freq
+        # Fused clamp + normalize: out-of-range values (the common
+        # defensive case for LLM-supplied inputs) return an endpoint
+        # without ever paying for the log call
+        if frequency <= min_freq:
+            return 0.0
+        if frequency >= max_freq:
+            return 1.0
 
         # Optimization: Use pre-calculated values for default range
         if min_freq == DEFAULT_MIN_FREQ and max_freq == DEFAULT_MAX_FREQ:
-            return (math.log(frequency) - DEFAULT_FREQ_LN_MIN) / DEFAULT_FREQ_LN_RANGE
+            return _freq_to_norm_default(frequency)
 
         # Convert to logarithmic scale using natural log (faster than log10)
-        ln_min = math.log(min_freq)
-        ln_max = math.log(max_freq)
-        ln_freq = math.log(frequency)
+        ln_min = _log(min_freq)
+        ln_max = _log(max_freq)
+        ln_freq = _log(frequency)
 
         return (ln_freq - ln_min) / (ln_max - ln_min)
 
-    def _normalized_to_frequency(self, normalized, min_freq=10.0, max_freq=22000.0):
+    @staticmethod
+    def _normalized_to_frequency(normalized, min_freq=10.0, max_freq=22000.0):
         """
         Convert normalized value (0-1) to frequency in Hz using precise logarithmic scale.
 
@@ -1050,23 +1125,62 @@ class AbletonMCP(ControlSurface):
             raise ValueError(
                 "Minimum frequency must be positive for logarithmic scale")
 
-        if normalized < 0.0:
-            normalized = 0.0
-        if normalized > 1.0:
-            normalized = 1.0
+        normalized = max(0.0, min(normalized, 1.0))
 
         # Optimization: Use pre-calculated values for default range
         if min_freq == DEFAULT_MIN_FREQ and max_freq == DEFAULT_MAX_FREQ:
             ln_freq = normalized * DEFAULT_FREQ_LN_RANGE + DEFAULT_FREQ_LN_MIN
-            return math.exp(ln_freq)
+            return _exp(ln_freq)
 
-        ln_min = math.log(min_freq)
-        ln_max = math.log(max_freq)
+        ln_min = _log(min_freq)
+        ln_max = _log(max_freq)
 
         ln_freq = normalized * (ln_max - ln_min) + ln_min
-        return math.exp(ln_freq)
+        return _exp(ln_freq)
+
+    def _frequencies_to_normalized(self, frequencies, min_freq=10.0, max_freq=22000.0):
+        """
+        Convert a sequence of frequencies to normalized values (0-1) in one
+        pass, for multi-band EQ writes.
 
-    def _q_to_normalized(self, q, min_q=0.1, max_q=18.0):
+        Binds the conversion constants to locals once and loops in a single
+        comprehension, so per-band calls skip the validation and dispatch
+        overhead of the scalar helper. (Live's embedded Python has no
+        NumPy, so this is the closest thing to a vectorized path.)
+        """
+        if min_freq == DEFAULT_MIN_FREQ and max_freq == DEFAULT_MAX_FREQ:
+            log = _log
+            ln_min = DEFAULT_FREQ_LN_MIN
+            inv = DEFAULT_FREQ_LN_RANGE_INV
+            return [
+                (log(max(min_freq, min(float(frequency), max_freq))) - ln_min) * inv
+                for frequency in frequencies
+            ]
+        return [
+            self._frequency_to_normalized(frequency, min_freq, max_freq)
+            for frequency in frequencies
+        ]
+
+    def _normalized_to_frequencies(self, normalized_values, min_freq=10.0, max_freq=22000.0):
+        """
+        Convert a sequence of normalized values (0-1) back to frequencies
+        in one pass. Batch counterpart of _normalized_to_frequency.
+        """
+        if min_freq == DEFAULT_MIN_FREQ and max_freq == DEFAULT_MAX_FREQ:
+            exp = _exp
+            ln_min = DEFAULT_FREQ_LN_MIN
+            ln_range = DEFAULT_FREQ_LN_RANGE
+            return [
+                exp(max(0.0, min(float(normalized), 1.0)) * ln_range + ln_min)
+                for normalized in normalized_values
+            ]
+        return [
+            self._normalized_to_frequency(normalized, min_freq, max_freq)
+            for normalized in normalized_values
+        ]
+
+    @staticmethod
+    def _q_to_normalized(q, min_q=0.1, max_q=18.0):
         """
         Convert Q value to normalized value (0-1) using logarithmic scale.
 
@@ -1084,22 +1198,24 @@ class AbletonMCP(ControlSurface):
         except (ValueError, TypeError):
             raise ValueError("Q values must be numeric")
 
-        if q < min_q:
-            q = min_q
-        if q > max_q:
-            q = max_q
+        # Fused clamp + normalize: endpoints return without a log call
+        if q <= min_q:
+            return 0.0
+        if q >= max_q:
+            return 1.0
 
         # Optimization: Use pre-calculated values for default range
         if min_q == DEFAULT_MIN_Q and max_q == DEFAULT_MAX_Q:
-            return (math.log(q) - DEFAULT_Q_LN_MIN) / DEFAULT_Q_LN_RANGE
+            return _q_to_norm_default(q)
 
-        ln_min = math.log(min_q)
-        ln_max = math.log(max_q)
-        ln_q = math.log(q)
+        ln_min = _log(min_q)
+        ln_max = _log(max_q)
+        ln_q = _log(q)
 
         return (ln_q - ln_min) / (ln_max - ln_min)
 
-    def _normalized_to_q(self, normalized, min_q=0.1, max_q=18.0):
+    @staticmethod
+    def _normalized_to_q(normalized, min_q=0.1, max_q=18.0):
         """
         Convert normalized value (0-1) to Q value using logarithmic scale.
 
@@ -1115,21 +1231,18 @@ class AbletonMCP(ControlSurface):
         except (ValueError, TypeError):
             raise ValueError("Values must be numeric")
 
-        if normalized < 0.0:
-            normalized = 0.0
-        if normalized > 1.0:
-            normalized = 1.0
+        normalized = max(0.0, min(normalized, 1.0))
 
         # Optimization: Use pre-calculated values for default range
         if min_q == DEFAULT_MIN_Q and max_q == DEFAULT_MAX_Q:
             ln_q = normalized * DEFAULT_Q_LN_RANGE + DEFAULT_Q_LN_MIN
-            return math.exp(ln_q)
+            return _exp(ln_q)
 
-        ln_min = math.log(min_q)
-        ln_max = math.log(max_q)
+        ln_min = _log(min_q)
+        ln_max = _log(max_q)
 
         ln_q = normalized * (ln_max - ln_min) + ln_min
-        return math.exp(ln_q)
+        return _exp(ln_q)
 
     def _find_browser_item_by_uri(self, browser_or_item, uri, max_depth=10, current_depth=0):
         """Find a browser item by its URI"""
@@ -1651,6 +1764,17 @@ class AbletonMCP(ControlSurface):
             # Without this map, applying a preset could take 40-50 linear searches through the parameter list.
             param_map = self._get_parameter_map(device)
 
+            # Batch-convert every preset frequency in one pass; the band
+            # loop below then just looks up its precomputed value.
+            freq_by_band = {
+                band_index: settings["freq"]
+                for band_index, settings in preset.items()
+                if settings.get("enabled", False) and "freq" in settings
+            }
+            normalized_freqs = dict(zip(
+                freq_by_band,
+                self._frequencies_to_normalized(freq_by_band.values())))
+
             # Apply preset settings
             for band_index, settings in preset.items():
                 band_settings = {}
@@ -1679,13 +1803,10 @@ class AbletonMCP(ControlSurface):
 
                         freq_param = param_map[freq_param_name]
 
-                        # Convert frequency to normalized value (0-1) using precise logarithmic mapping
-                        frequency = settings["freq"]
-                        normalized_value = self._frequency_to_normalized(
-                            frequency)
-
-                        freq_param.value = normalized_value
-                        band_settings["freq"] = frequency
+                        # Normalized value (0-1) precomputed in the batch
+                        # pass above
+                        freq_param.value = normalized_freqs[band_index]
+                        band_settings["freq"] = settings["freq"]
 
                     # Set gain if provided
                     if "gain" in settings:
@@ -2077,22 +2198,13 @@ class AbletonMCP(ControlSurface):
         Returns:
             Volume in dB
         """
-        # Add a small epsilon to prevent extreme negative values
-        # when value is very close to zero but not exactly zero
-        epsilon = 1e-7
-
-        if value <= epsilon:
-            return float('-inf')  # -infinity dB for zero or near-zero volume
-
-        # Ableton's volume mapping is approximately:
-        # 0.85 -> 0dB
-        # 0.0 -> -inf dB
-        # 1.0 -> +6dB
-
-        if value < 0.85:
-            # Below 0dB
-            # Optimization: Use natural log with pre-calculated constant (faster than log10)
-            return DB_SCALE_CONSTANT * math.log(value / 0.85)
-        else:
-            # Above 0dB (0.85 to 1.0 maps to 0dB to +6dB)
-            return 6 * (value - 0.85) / 0.15
+        # Fast path: values landing exactly on the 0.001 grid (the common
+        # case for UI-driven mixer levels) are answered from the LUT. The
+        # equality check guarantees the table entry is the exact result,
+        # so off-grid values fall through to the full computation.
+        if 0.0 <= value <= 1.0:
+            index = int(value * 1000.0 + 0.5)
+            if index / 1000.0 == value:
+                return _DB_LUT[index]
+
+        return _linear_to_db_exact(value)
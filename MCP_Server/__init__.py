@@ -1,6 +1,17 @@
 """Ableton Live integration through the Model Context Protocol."""
 
-__version__ = "0.1.0"
+from ._version import __version__
 
-# Expose key classes and functions for easier imports
-from .server import AbletonConnection, get_ableton_connection
\ No newline at end of file
+# Expose key classes and functions for easier imports without eagerly
+# importing the full MCP server stack (PEP 562 lazy re-export). This keeps
+# `MCP_Server.cli` fast paths like `version`/`--help` from paying for the
+# server import graph.
+_SERVER_EXPORTS = ("AbletonConnection", "get_ableton_connection")
+
+
+def __getattr__(name):
+    if name in _SERVER_EXPORTS:
+        from . import server
+        return getattr(server, name)
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}")
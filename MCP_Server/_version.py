@@ -0,0 +1,8 @@
+"""Static package version.
+
+Keep in sync with the version in pyproject.toml. Having the version as a
+plain module attribute lets get_version() avoid the importlib.metadata
+machinery (and its ~20 ms cold-start cost) on every CLI invocation.
+"""
+
+__version__ = "1.0.0"
@@ -5,35 +5,52 @@ the Model Context Protocol
 """
 
 import argparse
+import fnmatch
+import functools
 import logging
+import re
 import sys
 import os
-import asyncio
-import socket
+from types import MappingProxyType
 from typing import List, Optional
-import importlib.metadata
 
-# Rich imports for UX
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+# Rich and the MCP server stack are imported lazily inside the functions
+# that need them, so fast paths like `ableton-mcp version` and `--help`
+# don't pay for the full import graph.
 
-from .server import mcp, main as server_main
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured (basicConfig) in the server branch of main();
+# getLogger alone has no handler side effects, so help/version paths skip
+# handler installation entirely.
 logger = logging.getLogger("AbletonMCP-CLI")
 
-# Initialize Rich console
-console = Console()
+# Lazily-constructed Rich console shared by all commands
+_console = None
+
+
+def _get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get the current version of the package."""
+    """Get the current version of the package.
+
+    Cached so repeated callers (version banner, info header, server
+    startup) only pay for the lookup once per process.
+    """
+    # Fast path: the static version module shipped with the package.
+    try:
+        from ._version import __version__
+        return __version__
+    except ImportError:
+        pass
+
+    import importlib.metadata
     try:
         return importlib.metadata.version("ableton-mcp")
     except importlib.metadata.PackageNotFoundError:
@@ -43,7 +60,16 @@ def get_version() -> str:
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             pyproject_path = os.path.join(base_dir, "pyproject.toml")
             if os.path.exists(pyproject_path):
-                # Simple parsing to avoid adding tomllib/toml dependency for just version
+                try:
+                    # C-implemented parser, stdlib since 3.11
+                    import tomllib
+                except ImportError:
+                    tomllib = None
+                if tomllib is not None:
+                    with open(pyproject_path, "rb") as f:
+                        return tomllib.load(f)["project"]["version"]
+                # Python 3.10: simple line scan, avoiding a toml dependency
+                # for just the version
                 with open(pyproject_path, "r") as f:
                     for line in f:
                         if line.strip().startswith("version ="):
@@ -53,17 +79,8 @@ def get_version() -> str:
         return "unknown"
 
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="ableton-mcp",
-        description="Ableton Live integration through the Model Context "
-                    "Protocol",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-
-    # Server command
+def _add_server_parser(subparsers) -> None:
+    """Register the `server` subcommand."""
     server_parser = subparsers.add_parser(
         "server", help="Start the MCP server")
     server_parser.add_argument(
@@ -84,19 +101,27 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Enable debug logging"
     )
 
-    # Info command
+
+def _add_info_parser(subparsers) -> None:
+    """Register the `info` subcommand."""
     subparsers.add_parser(
         "info", help="Show information about the MCP server")
 
-    # Version command
+
+def _add_version_parser(subparsers) -> None:
+    """Register the `version` subcommand."""
     subparsers.add_parser(
         "version", help="Show version information")
 
-    # Doctor command
+
+def _add_doctor_parser(subparsers) -> None:
+    """Register the `doctor` subcommand."""
     subparsers.add_parser(
         "doctor", help="Check connection to Ableton Live and troubleshoot issues")
 
-    # Install command for Ableton Live Remote Script
+
+def _add_install_parser(subparsers) -> None:
+    """Register the `install` subcommand."""
     install_parser = subparsers.add_parser(
         "install",
         help="Install the Ableton Live Remote Script"
@@ -111,11 +136,53 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Force installation even if the script already exists"
     )
 
+
+# Subcommand registration thunks, invoked on demand so a normal invocation
+# only pays for the one subparser it actually uses.
+_SUBCOMMANDS = {
+    "server": _add_server_parser,
+    "info": _add_info_parser,
+    "version": _add_version_parser,
+    "doctor": _add_doctor_parser,
+    "install": _add_install_parser,
+}
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="ableton-mcp",
+        description="Ableton Live integration through the Model Context "
+                    "Protocol",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    # Only build the subparser for the requested command; fall back to
+    # registering everything when help is requested or the first token is
+    # not a known command (so argparse can produce the usual error/usage).
+    argv = args if args is not None else sys.argv[1:]
+    command = argv[0] if argv else None
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subparser in _SUBCOMMANDS.values():
+            add_subparser(subparsers)
+
     return parser.parse_args(args)
 
 
 def show_version() -> None:
     """Show version information."""
+    # Piped/redirected output (CI, `version | grep`) gets a bare print:
+    # no Rich import, no style computation.
+    if not sys.stdout.isatty():
+        print(f"Ableton MCP v{get_version()}")
+        return
+
+    from rich.panel import Panel
+    from rich.text import Text
+
     version_text = Text()
     version_text.append(f"🎵 Ableton MCP v{get_version()}\n", style="bold cyan")
     version_text.append(
@@ -123,47 +190,102 @@ def show_version() -> None:
     version_text.append(
         "🔗 https://github.com/itsuzef/ableton-mcp", style="blue underline")
 
-    console.print(Panel(version_text, border_style="cyan"))
+    _get_console().print(Panel(version_text, border_style="cyan"))
+
+
+def _load_tool_manifest() -> Optional[dict]:
+    """
+    Load the prebuilt tool manifest (name -> description summary), or None
+    if it is missing or unreadable.
+
+    The manifest is generated by scripts/gen_tool_manifest.py at release
+    time so `ableton-mcp info` can render without importing the MCP
+    server stack.
+    """
+    import json
+
+    try:
+        from importlib.resources import files
+        raw = files(__package__).joinpath("_tool_manifest.json").read_text()
+        return json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+# Categories shown by `ableton-mcp info`, in display order. Frozen
+# (read-only mapping, tuple values) so the tables are interned once and
+# cannot drift at runtime.
+_TOOL_CATEGORIES = MappingProxyType({
+    "Session & Transport": (
+        "get_session_info", "start_playback", "stop_playback",
+        "set_tempo"
+    ),
+    "Tracks & Mixing": (
+        "get_track_info", "create_midi_track", "create_return_track",
+        "set_track_name", "set_track_volume", "set_send_level"
+    ),
+    "Clips & Notes": (
+        "create_clip", "fire_clip", "stop_clip",
+        "add_notes_to_clip", "set_clip_name"
+    ),
+    "Devices & Effects": (
+        "get_device_parameters", "set_device_parameter",
+        "load_instrument_or_effect", "set_eq_band",
+        "set_eq_global", "apply_eq_preset"
+    ),
+    "Browser": (
+        "get_browser_tree", "get_browser_items_at_path",
+        "load_drum_kit"
+    )
+})
+
+# Reverse index (tool name -> category) so classifying a tool is one dict
+# lookup; built once at import rather than per info invocation.
+_CATEGORY_OF_TOOL = MappingProxyType({
+    name: category
+    for category, tool_names in _TOOL_CATEGORIES.items()
+    for name in tool_names
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tools_cached() -> tuple:
+    """Read the registered tools from the live server, once per process."""
+    from .server import mcp
+    return tuple(mcp._tool_manager.list_tools())
 
 
 def show_info() -> None:
     """Show information about the MCP server."""
-    console.print(Panel.fit(
+    from collections import defaultdict, namedtuple
+
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.rule import Rule
+    from rich.table import Table
+
+    console = _get_console()
+
+    # Accumulate renderables and flush them in a single console.print at
+    # the end — each print call re-parses markup and recomputes styles, so
+    # buffering avoids paying that cost per category.
+    renderables = [Panel.fit(
         f"[bold]Ableton MCP[/bold] v{get_version()}\n[italic]Ableton Live integration through the Model Context Protocol[/italic]",
         border_style="cyan"
-    ))
-
-    # Get all registered functions from the MCP server
-    async def get_tools():
-        return await mcp.list_tools()
+    )]
 
     try:
-        tools = asyncio.run(get_tools())
-
-        # Define categories
-        categories = {
-            "Session & Transport": [
-                "get_session_info", "start_playback", "stop_playback",
-                "set_tempo"
-            ],
-            "Tracks & Mixing": [
-                "get_track_info", "create_midi_track", "create_return_track",
-                "set_track_name", "set_track_volume", "set_send_level"
-            ],
-            "Clips & Notes": [
-                "create_clip", "fire_clip", "stop_clip",
-                "add_notes_to_clip", "set_clip_name"
-            ],
-            "Devices & Effects": [
-                "get_device_parameters", "set_device_parameter",
-                "load_instrument_or_effect", "set_eq_band",
-                "set_eq_global", "apply_eq_preset"
-            ],
-            "Browser": [
-                "get_browser_tree", "get_browser_items_at_path",
-                "load_drum_kit"
-            ]
-        }
+        # Prefer the prebuilt manifest; fall back to introspecting the
+        # live server. The registry itself is an in-memory dict, so even
+        # the fallback reads it synchronously instead of paying
+        # asyncio.run's event-loop setup/teardown to await mcp.list_tools().
+        manifest = _load_tool_manifest()
+        if manifest is not None:
+            ToolSummary = namedtuple("ToolSummary", ["name", "description"])
+            tools = [ToolSummary(name, summary)
+                     for name, summary in manifest.items()]
+        else:
+            tools = _get_tools_cached()
 
         # Helper to get description summary
         def get_summary(tool):
@@ -172,140 +294,205 @@ def show_info() -> None:
             # Get first line and strip
             return tool.description.strip().split('\n')[0].strip()
 
-        # Map tools by name for easy lookup
-        tool_map = {t.name: t for t in tools}
-
-        # Track which tools we've displayed
-        displayed_tools = set()
-
-        for category, tool_names in categories.items():
-            # Create a table for each category
+        def make_table(members):
             table = Table(box=None, show_header=False, padding=(0, 2))
             table.add_column("Tool", style="cyan bold", width=30)
             table.add_column("Description")
-
-            has_items = False
-            for name in tool_names:
-                if name in tool_map:
-                    tool = tool_map[name]
-                    summary = get_summary(tool)
-                    table.add_row(name, summary)
-                    displayed_tools.add(name)
-                    has_items = True
-
-            if has_items:
-                console.print()
-                console.rule(f"[bold blue]📂 {category}[/bold blue]")
-                console.print(table)
+            for tool in members:
+                table.add_row(tool.name, get_summary(tool))
+            return table
+
+        # One dict lookup per tool against the module-level reverse index
+        # classifies everything in a single pass, with no second scan for
+        # uncategorized tools.
+        by_category = defaultdict(list)
+        for tool in tools:
+            by_category[_CATEGORY_OF_TOOL.get(tool.name)].append(tool)
+
+        for category, order in _TOOL_CATEGORIES.items():
+            members = by_category.get(category)
+            if members:
+                # Render in the curated category order, not manifest order
+                members.sort(key=lambda tool: order.index(tool.name))
+                renderables.append(Rule(f"[bold blue]📂 {category}[/bold blue]"))
+                renderables.append(make_table(members))
 
         # Display any remaining tools (uncategorized)
-        remaining = [t for t in tools if t.name not in displayed_tools]
+        remaining = by_category.get(None)
         if remaining:
-            console.print()
-            console.rule("[bold yellow]🔧 Other Tools[/bold yellow]")
-            table = Table(box=None, show_header=False, padding=(0, 2))
-            table.add_column("Tool", style="cyan bold", width=30)
-            table.add_column("Description")
-
-            for tool in remaining:
-                summary = get_summary(tool)
-                table.add_row(tool.name, summary)
-
-            console.print(table)
+            renderables.append(Rule("[bold yellow]🔧 Other Tools[/bold yellow]"))
+            renderables.append(make_table(remaining))
 
     except Exception as e:
-        console.print(Panel(f"❌ Error listing tools: {e}", border_style="red"))
+        renderables.append(
+            Panel(f"❌ Error listing tools: {e}", border_style="red"))
 
-    console.print()
-    console.print(Panel(
+    renderables.append(Panel(
         "💡 For more information, start the server and visit [link=http://localhost:8000/docs]http://localhost:8000/docs[/link]",
         border_style="yellow"
     ))
+    console.print(Group(*renderables))
 
 
-def find_ableton_script_path() -> Optional[str]:
+# Matches the Live version number in an install directory name, e.g.
+# "Live 11 Suite" or "Ableton Live 12.app".
+_ABLETON_VERSION_RE = re.compile(r"Live (\d+(?:\.\d+)?)")
+
+
+def _ableton_search_roots() -> List[tuple]:
     """
-    Attempt to find the Ableton Live Remote Scripts directory.
-    Returns None if not found.
+    Build the per-platform list of (parent_dir, name_pattern, subpath)
+    triples to search for the Remote Scripts directory, in priority order.
+
+    Install names are matched by pattern rather than a hardcoded version
+    list, so new Live releases are picked up without code changes.
     """
-    possible_paths = []
+    roots = []
 
-    # macOS paths
     if sys.platform == "darwin":
         home = os.path.expanduser("~")
-        possible_paths.extend([
-            f"{home}/Music/Ableton/Live 11 Suite/Resources/MIDI Remote Scripts",
-            f"{home}/Music/Ableton/Live 10 Suite/Resources/MIDI Remote Scripts",
-            f"{home}/Music/Ableton/Live 11/Resources/MIDI Remote Scripts",
-            f"{home}/Music/Ableton/Live 10/Resources/MIDI Remote Scripts",
-            "/Applications/Ableton Live 11 Suite.app/Contents/App-Resources/"
-            "MIDI Remote Scripts",
-            "/Applications/Ableton Live 10 Suite.app/Contents/App-Resources/"
-            "MIDI Remote Scripts",
-            "/Applications/Ableton Live 11.app/Contents/App-Resources/"
-            "MIDI Remote Scripts",
-            "/Applications/Ableton Live 10.app/Contents/App-Resources/"
-            "MIDI Remote Scripts",
-        ])
-
-    # Windows paths
+        roots.append((
+            f"{home}/Music/Ableton",
+            "Live *",
+            "Resources/MIDI Remote Scripts"))
+        roots.append((
+            "/Applications",
+            "Ableton Live *.app",
+            "Contents/App-Resources/MIDI Remote Scripts"))
+
     elif sys.platform == "win32":
         program_files = os.environ.get("ProgramFiles", "C:\\Program Files")
         program_files_x86 = os.environ.get(
             "ProgramFiles(x86)", "C:\\Program Files (x86)")
-        possible_paths.extend([
-            f"{program_files}\\Ableton\\Live 11 Suite\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files}\\Ableton\\Live 10 Suite\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files}\\Ableton\\Live 11\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files}\\Ableton\\Live 10\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files_x86}\\Ableton\\Live 11 Suite\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files_x86}\\Ableton\\Live 10 Suite\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files_x86}\\Ableton\\Live 11\\Resources\\"
-            "MIDI Remote Scripts",
-            f"{program_files_x86}\\Ableton\\Live 10\\Resources\\"
-            "MIDI Remote Scripts",
-        ])
-
-    # Linux paths
+        for base in (program_files, program_files_x86):
+            roots.append((
+                f"{base}\\Ableton",
+                "Live *",
+                "Resources\\MIDI Remote Scripts"))
+
     elif sys.platform == "linux":
         home = os.path.expanduser("~")
-        possible_paths.extend([
-            f"{home}/.config/ableton/Live 11 Suite/Resources/"
-            "MIDI Remote Scripts",
-            f"{home}/.config/ableton/Live 10 Suite/Resources/"
-            "MIDI Remote Scripts",
-            f"{home}/.config/ableton/Live 11/Resources/"
-            "MIDI Remote Scripts",
-            f"{home}/.config/ableton/Live 10/Resources/"
-            "MIDI Remote Scripts",
-        ])
-
-    # Check if any of the paths exist
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
+        roots.append((
+            f"{home}/.config/ableton",
+            "Live *",
+            "Resources/MIDI Remote Scripts"))
+
+    return roots
+
+
+def _install_sort_key(name: str):
+    """Sort key ranking install names: newest version first, Suite first."""
+    match = _ABLETON_VERSION_RE.search(name)
+    version = float(match.group(1)) if match else 0.0
+    return (-version, "Suite" not in name)
+
+
+# The platform never changes within a process, so expand the search roots
+# (expanduser, environment lookups, string formatting) once at import time.
+_ABLETON_SEARCH_ROOTS = _ableton_search_roots()
+
+
+def _list_dir_names(parent: str) -> frozenset:
+    """Return the entry names of a directory, or an empty set if unreadable."""
+    try:
+        with os.scandir(parent) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _script_path_cache_file() -> str:
+    """Path of the hint file remembering a previously discovered path."""
+    return os.path.join(
+        os.path.expanduser("~"), ".cache", "ableton-mcp", "scripts_path")
+
+
+def _cache_script_path(path: str) -> None:
+    """Persist a discovered scripts path so later runs skip the scan."""
+    cache_file = _script_path_cache_file()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w") as f:
+            f.write(path)
+    except OSError:
+        # Caching is best-effort; discovery still works without it.
+        pass
+
+
+def find_ableton_script_path() -> Optional[str]:
+    """
+    Attempt to find the Ableton Live Remote Scripts directory.
+    Returns None if not found.
+
+    The ABLETON_MIDI_SCRIPTS_PATH environment variable and a cached hint
+    file from a previous discovery are consulted first, so non-standard
+    installs and repeat runs skip the directory scan entirely.
+    """
+    env_path = os.environ.get("ABLETON_MIDI_SCRIPTS_PATH")
+    if env_path and os.path.isdir(env_path):
+        return env_path
+
+    try:
+        with open(_script_path_cache_file()) as f:
+            cached = f.read().strip()
+        if cached and os.path.isdir(cached):
+            return cached
+    except OSError:
+        pass
+
+    # One scandir per parent instead of a stat per candidate: list each
+    # directory once and match install names in memory. With several
+    # parents to probe, overlap the scans in a small thread pool so total
+    # latency is the slowest scan, not the sum (matters on cold caches and
+    # network-mounted home directories). Priority order is preserved.
+    roots = _ABLETON_SEARCH_ROOTS
+    if len(roots) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+            listings = list(executor.map(
+                _list_dir_names, (parent for parent, _, _ in roots)))
+    else:
+        listings = [_list_dir_names(parent) for parent, _, _ in roots]
+
+    for (parent, pattern, subpath), present in zip(roots, listings):
+        for name in sorted(fnmatch.filter(present, pattern),
+                           key=_install_sort_key):
+            path = os.path.join(parent, name, subpath)
+            if os.path.exists(path):
+                _cache_script_path(path)
+                return path
 
     return None
 
 
+async def _gather_doctor_checks():
+    """Run the filesystem and socket probes concurrently."""
+    import asyncio
+
+    return await asyncio.gather(
+        asyncio.to_thread(find_ableton_script_path),
+        asyncio.to_thread(check_ableton_connection))
+
+
 def run_doctor() -> None:
     """Run diagnostics to help troubleshoot issues."""
+    import asyncio
+
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print(Panel(
         "[bold]🏥 Ableton MCP Doctor[/bold]\n"
         "Checking your environment...",
         border_style="cyan"
     ))
 
+    # Run the script-path scan and the connection probe concurrently so
+    # doctor latency is the slower of the two, not their sum.
+    script_path, is_connected = asyncio.run(_gather_doctor_checks())
+
     # Check 1: Remote Script Installation
     console.print("[bold]1. 📂 Remote Script Installation[/bold]")
-
-    script_path = find_ableton_script_path()
     if script_path:
         installed_path = os.path.join(script_path, "AbletonMCP_Remote_Script")
         if os.path.exists(installed_path):
@@ -321,7 +508,7 @@ def run_doctor() -> None:
 
     # Check 2: Connection
     console.print("[bold]2. 🔌 Connection to Ableton Live[/bold]")
-    if check_ableton_connection():
+    if is_connected:
         console.print("   [green]✅ Connected to Ableton Live![/green]")
     else:
         console.print("   [red]❌ Could not connect to Ableton Live.[/red]")
@@ -338,11 +525,22 @@ def run_doctor() -> None:
 def install_remote_script(
         ableton_path: Optional[str] = None, force: bool = False) -> None:
     """Install the Ableton Live Remote Script."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    console = _get_console()
     console.print("[bold]📦 Installing Ableton Live Remote Script...[/bold]")
 
     # Determine the source path (where the Remote Script files are in our
-    # package)
-    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # package). Resolve through importlib.resources, which uses the import
+    # system's cached location; fall back to __file__ for loaders that
+    # don't expose a filesystem path.
+    from importlib.resources import files
+    try:
+        package_dir = os.path.dirname(os.fspath(files(__package__)))
+    except TypeError:
+        package_dir = os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))
     source_path = os.path.join(package_dir, "AbletonMCP_Remote_Script")
 
     if not os.path.exists(source_path):
@@ -358,20 +556,23 @@ def install_remote_script(
             target_base_path = find_ableton_script_path()
 
         if not target_base_path:
-            console.print(
-                "\n[yellow]⚠️  Could not automatically find Ableton Live Remote Scripts directory.[/yellow]")
-            console.print("Common locations:")
             if sys.platform == "darwin":
-                console.print(
-                    "  • /Applications/Ableton Live 11 Suite.app/Contents/App-Resources/MIDI Remote Scripts")
+                example_path = (
+                    "/Applications/Ableton Live 11 Suite.app/Contents/App-Resources/MIDI Remote Scripts")
             elif sys.platform == "win32":
-                console.print(
-                    "  • C:\\Program Files\\Ableton\\Live 11 Suite\\Resources\\MIDI Remote Scripts")
+                example_path = (
+                    "C:\\Program Files\\Ableton\\Live 11 Suite\\Resources\\MIDI Remote Scripts")
             else:
-                console.print(
-                    "  • /path/to/ableton/MIDI Remote Scripts")
+                example_path = "/path/to/ableton/MIDI Remote Scripts"
 
-            console.print()
+            # One Panel instead of several sequential prints, so Rich only
+            # parses and flushes once on this path.
+            console.print(Panel(
+                "[yellow]⚠️  Could not automatically find Ableton Live Remote Scripts directory.[/yellow]\n\n"
+                "Common locations:\n"
+                f"  • {example_path}",
+                border_style="yellow"
+            ))
             target_base_path = Prompt.ask("[bold cyan]Please enter the path manually[/bold cyan]")
 
             if not target_base_path or not os.path.exists(target_base_path):
@@ -392,39 +593,36 @@ def install_remote_script(
         console.print("Use --force to reinstall")
         return
 
-    # Create the target directory if it doesn't exist
-    os.makedirs(target_path, exist_ok=True)
-
-    # Copy all files from source to target
+    # Copy the whole tree in one copytree call; it walks with os.scandir
+    # internally and uses the platform's zero-copy file paths. Count files
+    # through the copy_function hook to keep the summary line.
     import shutil
-    file_count = 0
+    copied = []
+
+    def _copy_and_count(src, dst, **kwargs):
+        copied.append(dst)
+        return shutil.copy2(src, dst, **kwargs)
+
     try:
-        for item in os.listdir(source_path):
-            source_item = os.path.join(source_path, item)
-            target_item = os.path.join(target_path, item)
-
-            if os.path.isfile(source_item):
-                shutil.copy2(source_item, target_item)
-                file_count += 1
-            elif os.path.isdir(source_item):
-                shutil.copytree(source_item, target_item, dirs_exist_ok=True)
-                file_count += 1
+        shutil.copytree(
+            source_path, target_path,
+            copy_function=_copy_and_count, dirs_exist_ok=True)
     except Exception as e:
         console.print(f"[bold red]❌ Error during installation: {e}[/bold red]")
         sys.exit(1)
 
+    file_count = len(copied)
+
     console.print(
         f"[green]✅ Copied {file_count} files to {target_path}[/green]")
 
-    steps = [
-        "Restart Ableton Live.",
-        "Open Preferences > Link/Tempo/MIDI.",
-        "Select [bold cyan]'AbletonMCP_Remote_Script'[/bold cyan] in the Control Surface list."
-    ]
-
-    steps_text = Text()
-    for i, step in enumerate(steps, 1):
-        steps_text.append_text(Text.from_markup(f"{i}. {step}\n"))
+    # One markup string parsed once, instead of a Text.from_markup call
+    # (and markup parse) per step.
+    steps_text = (
+        "1. Restart Ableton Live.\n"
+        "2. Open Preferences > Link/Tempo/MIDI.\n"
+        "3. Select [bold cyan]'AbletonMCP_Remote_Script'[/bold cyan] in the Control Surface list.\n"
+    )
 
     console.print(Panel(
         steps_text,
@@ -434,36 +632,122 @@ def install_remote_script(
     ))
 
 
-def check_ableton_connection(host: str = "127.0.0.1", port: int = 9877) -> bool:
-    """Check if Ableton Live Remote Script is reachable."""
+async def _probe_once(host: str, port: int, timeout: float) -> bool:
+    """Attempt one non-blocking TCP connect, bounded by `timeout`."""
+    import asyncio
+
     try:
-        with socket.create_connection((host, port), timeout=1.0):
-            return True
-    except OSError:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout)
+    except (OSError, asyncio.TimeoutError):
         return False
+    writer.close()
+    return True
+
+
+async def _probe_ableton(host: str, port: int, timeout: float,
+                         attempts: int = 3) -> bool:
+    """
+    Race several connect attempts and report success as soon as any one of
+    them completes, cancelling the rest. The extra attempts paper over
+    transient refusals while the Remote Script's socket server is coming
+    up, without serializing their timeouts.
+    """
+    import asyncio
+
+    tasks = [asyncio.ensure_future(_probe_once(host, port, timeout))
+             for _ in range(attempts)]
+    connected = False
+    for future in asyncio.as_completed(tasks):
+        if await future:
+            connected = True
+            break
+
+    for task in tasks:
+        task.cancel()
+    return connected
+
+
+def check_ableton_connection(host: str = "127.0.0.1", port: int = 9877,
+                             timeout: float = 0.1) -> bool:
+    """Check if Ableton Live Remote Script is reachable.
+
+    A localhost TCP handshake either completes in a few ms or the port is
+    simply closed, so the probes are bounded by a short timeout instead of
+    the previous 1 s, which only served to stall the CLI when Ableton
+    isn't running.
+    """
+    import asyncio
+
+    return asyncio.run(_probe_ableton(host, port, timeout))
+
+
+# Flagless commands that can be dispatched without building a parser
+_FAST_DISPATCH = {
+    "version": show_version,
+    "info": show_info,
+    "doctor": run_doctor,
+}
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # Bare `ableton-mcp version`/`info`/`doctor` take no flags, so skip
+    # argparse construction entirely for them; anything else (flags,
+    # `server`, `install`, help) falls through to the real parser.
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_DISPATCH:
+        _FAST_DISPATCH[sys.argv[1]]()
+        return
+
     args = parse_args()
 
     if args.command == "server":
-        # Configure logging level
-        if args.debug:
-            logging.getLogger().setLevel(logging.DEBUG)
-
-        # Start the server
-        console.print(Panel(
-            f"🚀 Starting [bold]Ableton MCP server[/bold] v{get_version()}\n"
-            f"📡 Listening on [link=http://{args.host}:{args.port}]http://{args.host}:{args.port}[/link]\n\n"
-            "🛑 Press [bold red]Ctrl+C[/bold red] to stop the server",
-            border_style="green",
-            title="Server Starting"
-        ))
-
-        # Check Ableton connection
-        with console.status("[bold yellow]🔌 Checking connection to Ableton Live...[/bold yellow]"):
-            is_connected = check_ableton_connection()
+        import threading
+
+        # Kick off the Ableton probe immediately so its socket wait
+        # overlaps the heavy server import and Rich setup below instead of
+        # blocking after them.
+        probe_result = {}
+
+        def probe():
+            probe_result["connected"] = check_ableton_connection()
+
+        probe_thread = threading.Thread(target=probe, daemon=True)
+        probe_thread.start()
+
+        from rich.panel import Panel
+
+        from .server import main as server_main
+
+        console = _get_console()
+
+        # Configure logging
+        logging.basicConfig(
+            level=logging.DEBUG if args.debug else logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        # Startup banner, deferred until the server reports it is about to
+        # serve (see server_main's on_ready) so a failed startup doesn't
+        # print a misleading banner and Rich only renders once. Under a
+        # non-TTY (systemd, Docker logs) use a plain log line instead.
+        def print_banner():
+            if sys.stdout.isatty():
+                console.print(Panel(
+                    f"🚀 Starting [bold]Ableton MCP server[/bold] v{get_version()}\n"
+                    f"📡 Listening on [link=http://{args.host}:{args.port}]http://{args.host}:{args.port}[/link]\n\n"
+                    "🛑 Press [bold red]Ctrl+C[/bold red] to stop the server",
+                    border_style="green",
+                    title="Server Starting"
+                ))
+            else:
+                logger.info(
+                    "Starting Ableton MCP server v%s on http://%s:%s",
+                    get_version(), args.host, args.port)
+
+        # Collect the Ableton probe started above; by now the server
+        # import has hidden the socket wait.
+        probe_thread.join()
+        is_connected = probe_result.get("connected", False)
 
         if is_connected:
             console.print("[green]✅ Ableton Live detected![/green]")
@@ -490,8 +774,18 @@ def main() -> None:
         os.environ["MCP_HOST"] = args.host
         os.environ["MCP_PORT"] = str(args.port)
 
+        # Use uvloop for the long-running server when available (installed
+        # via the `ableton-mcp[uvloop]` extra); it is a drop-in event-loop
+        # replacement with markedly lower per-request latency. Not
+        # available on Windows, so skip silently.
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
         # Run the server
-        server_main()
+        server_main(on_ready=print_banner)
 
     elif args.command == "version":
         show_version()
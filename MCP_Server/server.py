@@ -1007,8 +1007,18 @@ def set_track_volume(ctx: Context, track_index: int, value: float) -> str:
 # Main execution
 
 
-def main():
-    """Run the MCP server"""
+def main(on_ready=None):
+    """Run the MCP server
+
+    Args:
+        on_ready: Optional zero-argument callable invoked once server
+            setup is complete, immediately before the transport starts
+            serving. Lets callers (e.g. the CLI) defer their startup
+            banner until the server is actually about to accept traffic.
+    """
+    if on_ready is not None:
+        on_ready()
+
     # Start the server
     mcp.run()
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Generate MCP_Server/_tool_manifest.json from the registered MCP tools.
+
+The manifest maps tool name -> first line of its description and is what
+`ableton-mcp info` renders, so the info command never has to import the
+full MCP server stack. Re-run this script whenever tools are added,
+removed, or their descriptions change:
+
+    python scripts/gen_tool_manifest.py
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def first_line(description):
+    if not description:
+        return ""
+    return description.strip().split('\n')[0].strip()
+
+
+def main():
+    from MCP_Server.server import mcp
+
+    manifest = {
+        tool.name: first_line(tool.description)
+        for tool in mcp._tool_manager.list_tools()
+    }
+
+    out_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "MCP_Server", "_tool_manifest.json")
+    with open(out_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print(f"Wrote {len(manifest)} tools to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Shared test fixtures for the AbletonMCP_Remote_Script unit tests.
+
+The Remote Script inherits from Live's _Framework.ControlSurface, which
+only exists inside Ableton. Installing a single mock here (at conftest
+import time, before any test module is collected) replaces the duplicated
+mock-setup blocks that used to live at the top of every test file, and
+guarantees every module sees the same MockControlSurface regardless of
+test collection order.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Make the repo root importable so tests can import AbletonMCP_Remote_Script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class MockControlSurface:
+    """Minimal stand-in for _Framework.ControlSurface."""
+
+    def __init__(self, c_instance=None):
+        # Cache the song/application mocks so repeated calls return the
+        # same object instead of allocating a fresh MagicMock each time.
+        self._song_mock = MagicMock()
+        self._app_mock = MagicMock()
+
+    def log_message(self, msg):
+        pass
+
+    def show_message(self, msg):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def schedule_message(self, delay, callback, *args):
+        # Live defers these to the main thread; in tests run them inline.
+        callback(*args)
+
+    def song(self):
+        return self._song_mock
+
+    def application(self):
+        return self._app_mock
+
+
+if '_Framework.ControlSurface' not in sys.modules:
+    mock_framework = MagicMock()
+    mock_framework.ControlSurface = MockControlSurface
+    sys.modules['_Framework'] = mock_framework
+    sys.modules['_Framework.ControlSurface'] = mock_framework
@@ -0,0 +1,69 @@
+import unittest
+import math
+from unittest.mock import MagicMock
+
+# The _Framework.ControlSurface mock is installed by tests/conftest.py
+
+from AbletonMCP_Remote_Script import AbletonMCP
+
+class TestBatchFrequencyConversion(unittest.TestCase):
+    """
+    Tests for the batch conversion helpers used by the multi-band EQ
+    write path (_apply_eq_preset). They must agree with the scalar
+    helpers for every element.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # The batch helpers are instance methods; one instance is enough
+        cls.mcp = AbletonMCP(MagicMock())
+
+    def test_batch_matches_scalar_defaults(self):
+        freqs = [10.0, 80.0, 250.0, 1000.0, 4000.0, 12000.0, 22000.0]
+        batch = self.mcp._frequencies_to_normalized(freqs)
+        scalar = [self.mcp._frequency_to_normalized(f) for f in freqs]
+
+        worst = max(abs(b - s) for b, s in zip(batch, scalar))
+        self.assertLess(worst, 1e-9,
+                        msg=f"batch diverged from scalar: {list(zip(freqs, batch, scalar))}")
+
+    def test_batch_matches_scalar_explicit_bounds(self):
+        freqs = [20.0, 100.0, 1000.0, 20000.0]
+        batch = self.mcp._frequencies_to_normalized(
+            freqs, min_freq=20.0, max_freq=20000.0)
+        scalar = [
+            self.mcp._frequency_to_normalized(f, min_freq=20.0, max_freq=20000.0)
+            for f in freqs
+        ]
+
+        worst = max(abs(b - s) for b, s in zip(batch, scalar))
+        self.assertLess(worst, 1e-9)
+
+    def test_batch_round_trip(self):
+        freqs = [20.0, 100.0, 440.0, 1000.0, 5000.0, 15000.0]
+        norms = self.mcp._frequencies_to_normalized(freqs)
+        backs = self.mcp._normalized_to_frequencies(norms)
+
+        worst = max(abs(f - b) for f, b in zip(freqs, backs))
+        self.assertLess(worst, 0.5e-4,
+                        msg=f"batch round trip drifted: {list(zip(freqs, backs))}")
+
+    def test_batch_clamps_out_of_range(self):
+        # Below min and above max clamp to the endpoints, like the scalar path
+        norms = self.mcp._frequencies_to_normalized([1.0, 50000.0])
+        self.assertAlmostEqual(norms[0], 0.0)
+        self.assertAlmostEqual(norms[1], 1.0)
+
+        backs = self.mcp._normalized_to_frequencies([-0.5, 1.5])
+        self.assertAlmostEqual(backs[0], 10.0)
+        self.assertAlmostEqual(backs[1], 22000.0)
+
+    def test_batch_endpoints_and_midpoint(self):
+        mid_freq = math.sqrt(10.0 * 22000.0)
+        norms = self.mcp._frequencies_to_normalized([10.0, mid_freq, 22000.0])
+        self.assertAlmostEqual(norms[0], 0.0)
+        self.assertAlmostEqual(norms[1], 0.5)
+        self.assertAlmostEqual(norms[2], 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,47 +1,19 @@
 import unittest
-import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-# Define a dummy ControlSurface class before importing AbletonMCP_Remote_Script
-class ControlSurface:
-    def __init__(self, c_instance):
-        self.c_instance = c_instance
-
-    def song(self):
-        return MagicMock()
-
-    def application(self):
-        return MagicMock()
-
-    def log_message(self, message):
-        pass
-
-    def show_message(self, message):
-        pass
-
-    def disconnect(self):
-        pass
-
-    def schedule_message(self, delay, func, *args):
-        func(*args)
-
-# Mock _Framework.ControlSurface
-module_mock = MagicMock()
-module_mock.ControlSurface = ControlSurface
-sys.modules["_Framework.ControlSurface"] = module_mock
-
-# Add the current directory to sys.path so we can import AbletonMCP_Remote_Script
-import os
-sys.path.append(os.getcwd())
+# The _Framework.ControlSurface mock is installed by tests/conftest.py
 
 from AbletonMCP_Remote_Script import AbletonMCP
 
 class TestEQEightMode(unittest.TestCase):
 
-    def setUp(self):
-        self.c_instance = MagicMock()
-        self.mcp = AbletonMCP(self.c_instance)
+    @classmethod
+    def setUpClass(cls):
+        # One shared instance; setUp swaps in fresh song mocks per test
+        cls.c_instance = MagicMock()
+        cls.mcp = AbletonMCP(cls.c_instance)
 
+    def setUp(self):
         # Setup mock song structure
         self.song = MagicMock()
         self.mcp._song = self.song
@@ -1,25 +1,8 @@
 import unittest
-import sys
 from unittest.mock import MagicMock
-import os
-
-# Define a dummy ControlSurface class before importing AbletonMCP_Remote_Script
-class ControlSurface:
-    def __init__(self, c_instance):
-        self.c_instance = c_instance
-    def song(self): return MagicMock()
-    def application(self): return MagicMock()
-    def log_message(self, message): pass
-    def show_message(self, message): pass
-    def disconnect(self): pass
-    def schedule_message(self, delay, func, *args): func(*args)
-
-# Mock _Framework.ControlSurface
-module_mock = MagicMock()
-module_mock.ControlSurface = ControlSurface
-sys.modules["_Framework.ControlSurface"] = module_mock
-
-sys.path.append(os.getcwd())
+
+# The _Framework.ControlSurface mock is installed by tests/conftest.py
+
 from AbletonMCP_Remote_Script import AbletonMCP
 
 class TestEQModeExists(unittest.TestCase):
@@ -1,43 +1,16 @@
 import unittest
-import sys
 import math
 from unittest.mock import MagicMock
-import os
 
-# Mock the _Framework.ControlSurface module structure
-module_name = '_Framework.ControlSurface'
-if module_name not in sys.modules:
-    mock_module = MagicMock()
-    # Create a dummy class that can be inherited from
-    class MockControlSurface:
-        def __init__(self, c_instance):
-            pass
-        def log_message(self, msg):
-            pass
-        def show_message(self, msg):
-            pass
-        def disconnect(self):
-            pass
-        def song(self):
-            return MagicMock()
-        def application(self):
-            return MagicMock()
-        def schedule_message(self, delay, callback, *args):
-            pass
-
-    mock_module.ControlSurface = MockControlSurface
-    sys.modules[module_name] = mock_module
-    sys.modules['_Framework'] = MagicMock()
-    sys.modules['_Framework'].ControlSurface = MockControlSurface
-
-# Add parent directory to sys.path
-sys.path.append(os.getcwd())
+# The _Framework.ControlSurface mock is installed by tests/conftest.py
 
 from AbletonMCP_Remote_Script import AbletonMCP
 
 class TestLinearToDb(unittest.TestCase):
-    def setUp(self):
-        self.mcp = AbletonMCP(MagicMock())
+    @classmethod
+    def setUpClass(cls):
+        # _linear_to_db is stateless, so one instance is enough
+        cls.mcp = AbletonMCP(MagicMock())
 
     def test_linear_to_db_values(self):
         # 0.85 -> 0 dB
@@ -1,37 +1,7 @@
 import unittest
-import sys
 import math
-from unittest.mock import MagicMock
-
-# Define a dummy ControlSurface class to inherit from
-class MockControlSurface:
-    def __init__(self, c_instance):
-        pass
-    def song(self):
-        return MagicMock()
-    def disconnect(self):
-        pass
-    def application(self):
-        return MagicMock()
-    def schedule_message(self, delay, callback, *args):
-        callback(*args)
-    def log_message(self, msg):
-        pass
-    def show_message(self, msg):
-        pass
-
-# Mock the module structure
-control_surface_module = MagicMock()
-control_surface_module.ControlSurface = MockControlSurface
-sys.modules['_Framework.ControlSurface'] = control_surface_module
-sys.modules['_Framework'] = MagicMock()
-
-# Now we can import the module to test
-sys.path.append('.')
-
-# Force reload if it was already loaded
-if 'AbletonMCP_Remote_Script' in sys.modules:
-    del sys.modules['AbletonMCP_Remote_Script']
+
+# The _Framework.ControlSurface mock is installed by tests/conftest.py
 
 from AbletonMCP_Remote_Script import AbletonMCP
 
@@ -41,6 +11,9 @@ class TestQValueConversion(unittest.TestCase):
     it matches the logarithmic scale requirement (0.1 to 18.0).
     """
 
+    # Geometric mean of the 0.1-18.0 Q range, computed once
+    _MID_Q = math.sqrt(0.1 * 18.0)
+
     def test_q_logarithmic_scaling(self):
         """Verify that Q conversion follows a logarithmic scale."""
         min_q = 0.1
@@ -50,25 +23,24 @@ class TestQValueConversion(unittest.TestCase):
         log_min = math.log10(min_q)
         log_max = math.log10(max_q)
 
-        # Test a few points
+        # Test a few points, comparing the whole batch at once (tolerance
+        # matches places=5)
         test_points = [0.1, 1.0, 5.0, 10.0, 18.0]
+        log_range = log_max - log_min
+        expected = [(math.log10(q) - log_min) / log_range for q in test_points]
+        actual = [AbletonMCP._q_to_normalized(q) for q in test_points]
 
-        for q in test_points:
-            log_q = math.log10(q)
-            expected_normalized = (log_q - log_min) / (log_max - log_min)
-
-            actual_normalized = AbletonMCP._q_to_normalized(None, q)
-
-            self.assertAlmostEqual(actual_normalized, expected_normalized, places=5,
-                                   msg=f"Failed for Q={q}")
+        worst = max(abs(a - e) for a, e in zip(actual, expected))
+        self.assertLess(worst, 0.5e-5,
+                        msg=f"Q scaling drifted: {list(zip(test_points, actual, expected))}")
 
     def test_q_limits(self):
         """Verify that Q values outside the range are clamped."""
         # Below min
-        self.assertEqual(AbletonMCP._q_to_normalized(None, 0.05), 0.0)
+        self.assertEqual(AbletonMCP._q_to_normalized(0.05), 0.0)
 
         # Above max
-        self.assertEqual(AbletonMCP._q_to_normalized(None, 20.0), 1.0)
+        self.assertEqual(AbletonMCP._q_to_normalized(20.0), 1.0)
 
     def test_normalized_to_q_conversion(self):
         """Verify that normalized value converts back to Q correctly."""
@@ -76,21 +48,20 @@ class TestQValueConversion(unittest.TestCase):
         max_q = 18.0
 
         # Test 0.0 -> min_q
-        self.assertAlmostEqual(AbletonMCP._normalized_to_q(None, 0.0), min_q)
+        self.assertAlmostEqual(AbletonMCP._normalized_to_q(0.0), min_q)
 
         # Test 1.0 -> max_q
-        self.assertAlmostEqual(AbletonMCP._normalized_to_q(None, 1.0), max_q)
+        self.assertAlmostEqual(AbletonMCP._normalized_to_q(1.0), max_q)
 
         # Test 0.5 -> Geometric mean
         # log(mid) = (log(min) + log(max)) / 2
         # mid = sqrt(min * max)
-        expected_mid = math.sqrt(min_q * max_q)
-        self.assertAlmostEqual(AbletonMCP._normalized_to_q(None, 0.5), expected_mid)
+        self.assertAlmostEqual(AbletonMCP._normalized_to_q(0.5), self._MID_Q)
 
         # Round trip test
         q_original = 2.5
-        normalized = AbletonMCP._q_to_normalized(None, q_original)
-        q_restored = AbletonMCP._normalized_to_q(None, normalized)
+        normalized = AbletonMCP._q_to_normalized(q_original)
+        q_restored = AbletonMCP._normalized_to_q(normalized)
         self.assertAlmostEqual(q_original, q_restored)
 
     def test_no_rough_approximation(self):
@@ -107,7 +78,7 @@ class TestQValueConversion(unittest.TestCase):
         q = 10.0
         rough_approx = q / 10.0  # 1.0
 
-        actual = AbletonMCP._q_to_normalized(None, q)
+        actual = AbletonMCP._q_to_normalized(q)
 
         # Ensure the actual value is significantly different from the rough approximation
         self.assertNotAlmostEqual(actual, rough_approx, delta=0.1)